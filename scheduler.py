@@ -1,8 +1,141 @@
+import asyncio
+import threading
+import time
 import requests
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from collections import OrderedDict
+from scheduler_interval_tree import IntervalTree
+
+try:
+    import orjson  # Необязательная зависимость: быстрый разбор JSON из байтов ответа
+except ImportError:
+    orjson = None
+
+# HTTP-сессии по одной на поток: переиспользуют соединения (keep-alive) между
+# загрузками, а потоки create_many не делят одну сессию
+_LOCAL = threading.local()
+
+# Кэш ответов API {url: (время загрузки, данные)} в порядке последнего обращения,
+# время жизни записи в секундах и наибольшее число хранимых URL
+_FETCH_CACHE = OrderedDict()
+_FETCH_TTL = 60.0
+_FETCH_CACHE_SIZE = 128
+_FETCH_LOCK = threading.Lock()
+
+# Строки 'ЧЧ:ММ' для каждой минуты суток, включая '24:00'
+_MINUTE_STRINGS = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60 + 1))
+
+# Сколько специализированных функций поиска слота хранит один планировщик
+_FINDER_CACHE_SIZE = 16
+
+
+def _get_session():
+    """Возвращает HTTP-сессию текущего потока, создавая ее при первом обращении.
+    Returns:
+        requests.Session: Сессия текущего потока
+    """
+    session = getattr(_LOCAL, 'session', None)
+    if session is None:
+        session = _LOCAL.session = requests.Session()
+    return session
+
+
+def _fetch_json(url):
+    """Загружает JSON с API, используя кэш ответов.
+    Повторные вызовы с тем же URL в пределах _FETCH_TTL возвращают тот же
+    объект, поэтому изменять результат нельзя.
+    Args:
+        url (str): URL endpoint для получения данных
+    Returns:
+        dict: Разобранный ответ API
+    Raises:
+        HTTPError: Если запрос к API не удался
+    """
+    now = time.monotonic()
+    with _FETCH_LOCK:
+        cached = _FETCH_CACHE.get(url)
+        if cached is not None:
+            if now - cached[0] < _FETCH_TTL:
+                _FETCH_CACHE.move_to_end(url)
+                return cached[1]  # Используем свежий ответ без повторного запроса
+            del _FETCH_CACHE[url]  # Удаляем устаревшую запись
+
+    response = _get_session().get(url, timeout=5)
+    response.raise_for_status()  # Проверяем на ошибки HTTP
+    data = orjson.loads(response.content) if orjson is not None else response.json()
+
+    with _FETCH_LOCK:
+        _FETCH_CACHE[url] = (now, data)
+        _FETCH_CACHE.move_to_end(url)
+        # Вытесняем URL, к которым дольше всего не обращались
+        while len(_FETCH_CACHE) > _FETCH_CACHE_SIZE:
+            _FETCH_CACHE.popitem(last=False)
+    return data
+
+
+def _merge_intervals(slots):
+    """Объединяет пересекающиеся интервалы в минутах.
+    Args:
+        slots (list): Список интервалов [(начало, конец), ...] в минутах
+    Returns:
+        list: Отсортированный список непересекающихся интервалов
+    """
+    if not slots:
+        return []
+
+    # Сортируем интервалы по времени начала (кортежи целых сравниваются без key)
+    sorted_slots = iter(sorted(slots))
+    merged = []
+    group_start, group_end = next(sorted_slots)
+
+    # Объединяем пересекающиеся интервалы, храня текущую группу в локальных переменных
+    for start, end in sorted_slots:
+        if start <= group_end:  # Если интервалы пересекаются
+            if end > group_end:
+                group_end = end  # Расширяем текущую группу
+        else:
+            merged.append((group_start, group_end))  # Закрываем группу
+            group_start, group_end = start, end
+
+    merged.append((group_start, group_end))
+    return merged
+
+
+def _free_intervals(busy_slots, work_start, work_end):
+    """Вычисляет свободные интервалы рабочего дня между занятыми.
+    Args:
+        busy_slots (list): Отсортированные непересекающиеся интервалы [(начало, конец), ...]
+        work_start (int): Начало рабочего дня в минутах
+        work_end (int): Конец рабочего дня в минутах
+    Returns:
+        list: Список кортежей (начало, конец, длительность) в минутах
+    """
+    free_slots = []
+    prev_end = work_start  # Отслеживаем конец последнего занятого/рабочего периода
+
+    for busy_start, busy_end in busy_slots:
+        if busy_start > prev_end:
+            # Добавляем свободный промежуток между предыдущим концом и началом занятого
+            free_slots.append((prev_end, busy_start, busy_start - prev_end))
+        if busy_end > prev_end:
+            prev_end = busy_end
+
+    # Добавляем оставшийся свободный промежуток в конце дня
+    if prev_end < work_end:
+        free_slots.append((prev_end, work_end, work_end - prev_end))
+
+    return free_slots
 
 
 class Scheduler:
+    __slots__ = (
+        'url', 'data', 'days', 'timeslots',
+        '_sorted_dates', '_id_to_date', '_trees', '_work_min_by_date',
+        '_merged_busy', '_starts_by_date', '_ends_by_date',
+        '_free_by_date', '_max_free_by_date', '_capacity_tree', '_tuple_cache',
+        '_finders', '_free_masks',
+    )
+
     def __init__(self, url):
         """Инициализация планировщика с URL API.
         Args:
@@ -12,37 +145,94 @@ class Scheduler:
         self.data = self._fetch_data()  # Загружаем данные при инициализации
         # Преобразуем дни в словарь {дата: день} для быстрого доступа
         self.days = {day['date']: day for day in self.data['days']}
+        # Даты 'ГГГГ-ММ-ДД' в лексикографическом порядке совпадают с хронологическим
+        self._sorted_dates = sorted(self.days)
+        # Соответствие {id дня: дата} для поиска даты таймслота за O(1)
+        self._id_to_date = {day['id']: day['date'] for day in self.data['days']}
         # Организуем таймслоты по датам
         self.timeslots = self._organize_timeslots()
+        # Разбираем время в минуты один раз, чтобы запросы работали с целыми числами
+        # Занятые интервалы каждой даты хранятся в дереве интервалов
+        self._trees = {
+            date: IntervalTree(self._parse_time_range(start, end) for start, end in slots)
+            for date, slots in self.timeslots.items()
+        }
+        self._work_min_by_date = {
+            date: self._parse_time_range(day['start'], day['end'])
+            for date, day in self.days.items()
+        }
+        # Кэш объединенных занятых интервалов {дата: [(начало, конец), ...]}
+        self._merged_busy = {}
+        # Начала объединенных интервалов {дата: [начало, ...]}, см. _get_busy_minutes
+        self._starts_by_date = {}
+        # Концы объединенных интервалов {дата: [конец, ...]}, параллельно началам
+        self._ends_by_date = {}
+        # Свободные интервалы {дата: [(начало, конец, длительность), ...]} в минутах
+        self._free_by_date = {date: self._compute_free_minutes(date) for date in self._sorted_dates}
+        # Самый длинный свободный интервал дня, чтобы пропускать заведомо неподходящие дни
+        self._max_free_by_date = {
+            date: max((duration for _, _, duration in free_slots), default=0)
+            for date, free_slots in self._free_by_date.items()
+        }
+        # Дерево отрезков максимумов свободного времени по дням в хронологическом порядке
+        self._capacity_tree = self._build_capacity_tree()
+        # Битовые маски свободных минут рабочего дня {дата: int}, бит i — минута i
+        self._free_masks = {date: self._compute_free_mask(date) for date in self._sorted_dates}
+        # Готовые пары строк {(начало, конец): ('ЧЧ:ММ', 'ЧЧ:ММ')} для ответов
+        self._tuple_cache = {}
+        # Функции поиска слота {длительность: функция}, см. _make_finder
+        self._finders = {}
 
     def _fetch_data(self):
         """Получение данных о расписании с API.
+        Ответы кэшируются, поэтому планировщики с одним URL разделяют один
+        объект self.data; планировщик его не изменяет.
         Returns:
             dict: Данные о рабочих днях и занятых слотах
         Raises:
             HTTPError: Если запрос к API не удался
         """
-        response = requests.get(self.url)
-        response.raise_for_status()  # Проверяем на ошибки HTTP
-        return response.json()
+        return _fetch_json(self.url)
+
+    @classmethod
+    async def create_many(cls, urls):
+        """Создает планировщики для нескольких URL, загружая данные параллельно.
+        Args:
+            urls (list): Список URL endpoint'ов с данными о расписании
+        Returns:
+            list: Список планировщиков в порядке переданных URL
+        Raises:
+            HTTPError: Если хотя бы один запрос к API не удался
+        """
+        # Каждый планировщик создается в своем потоке через _fetch_data класса,
+        # поэтому подклассы с собственной загрузкой данных тоже поддерживаются
+        schedulers = await asyncio.gather(*(asyncio.to_thread(cls, url) for url in urls))
+        return list(schedulers)
+
+    @staticmethod
+    def invalidate_cache(url=None):
+        """Сбрасывает кэш загруженных данных.
+        Args:
+            url (str): URL, для которого сбрасывается кэш; None сбрасывает весь кэш
+        """
+        with _FETCH_LOCK:
+            if url is None:
+                _FETCH_CACHE.clear()
+            else:
+                _FETCH_CACHE.pop(url, None)
 
     def _organize_timeslots(self):
         """Группирует таймслоты по датам для удобного доступа.
         Returns:
             dict: Словарь {дата: список таймслотов}
         """
-        timeslots_by_date = {}
         # Инициализируем пустые списки для каждой даты
-        for day in self.data['days']:
-            date = day['date']
-            timeslots_by_date[date] = []
+        timeslots_by_date = {day['date']: [] for day in self.data['days']}
 
         # Распределяем таймслоты по соответствующим датам
         for timeslot in self.data['timeslots']:
-            day_id = timeslot['day_id']
-            # Находим дату по day_id
-            date = next((day['date'] for day in self.data['days'] if day['id'] == day_id), None)
-            if date:
+            date = self._id_to_date.get(timeslot['day_id'])
+            if date is not None:
                 timeslots_by_date[date].append((timeslot['start'], timeslot['end']))
 
         return timeslots_by_date
@@ -50,10 +240,22 @@ class Scheduler:
     def _time_to_minutes(self, time_str):
         """Конвертирует время в формате 'ЧЧ:ММ' в минуты с начала дня.
         Args:
-            time_str (str): Время в формате 'ЧЧ:ММ'
+            time_str (str | bytes): Время в формате 'ЧЧ:ММ'
         Returns:
             int: Количество минут с начала дня
         """
+        if len(time_str) == 5:
+            if isinstance(time_str, bytes):
+                if time_str[2] == 58:  # b':'
+                    # Индексация bytes сразу дает коды цифр
+                    return ((time_str[0] - 48) * 10 + time_str[1] - 48) * 60 \
+                        + (time_str[3] - 48) * 10 + time_str[4] - 48
+            elif time_str[2] == ':':
+                # Быстрый путь для 'ЧЧ:ММ': считаем цифры напрямую по кодам символов
+                return ((ord(time_str[0]) - 48) * 10 + ord(time_str[1]) - 48) * 60 \
+                    + (ord(time_str[3]) - 48) * 10 + ord(time_str[4]) - 48
+        if isinstance(time_str, bytes):
+            time_str = time_str.decode('ascii')
         hours, minutes = map(int, time_str.split(':'))
         return hours * 60 + minutes
 
@@ -64,10 +266,26 @@ class Scheduler:
         Returns:
             str: Время в формате 'ЧЧ:ММ'
         """
+        if 0 <= minutes < len(_MINUTE_STRINGS):
+            return _MINUTE_STRINGS[minutes]
         hours = minutes // 60
         mins = minutes % 60
         return f"{hours:02d}:{mins:02d}"
 
+    def _make_pair(self, start, end):
+        """Возвращает общий кортеж строк 'ЧЧ:ММ' для интервала в минутах.
+        Args:
+            start (int): Начало интервала в минутах
+            end (int): Конец интервала в минутах
+        Returns:
+            tuple: (начало, конец) в формате 'ЧЧ:ММ'
+        """
+        pair = self._tuple_cache.get((start, end))
+        if pair is None:
+            pair = (self._minutes_to_time(start), self._minutes_to_time(end))
+            self._tuple_cache[(start, end)] = pair
+        return pair
+
     def _parse_time_range(self, start, end):
         """Парсит временной диапазон в минуты.
         Args:
@@ -85,23 +303,34 @@ class Scheduler:
         Returns:
             list: Список объединенных интервалов
         """
-        if not slots:
-            return []
-
-        # Сортируем интервалы по времени начала
-        sorted_slots = sorted(slots, key=lambda x: x[0])
-        merged = [sorted_slots[0]]
-
-        # Объединяем пересекающиеся интервалы
-        for current in sorted_slots[1:]:
-            last = merged[-1]
-            if current[0] <= last[1]:  # Если интервалы пересекаются
-                merged[-1] = (last[0], max(last[1], current[1]))  # Объединяем
-            else:
-                merged.append(current)  # Добавляем новый интервал
+        return _merge_intervals(slots)
 
+    def _get_merged_busy(self, date):
+        """Возвращает объединенные занятые интервалы даты в минутах, кэшируя результат.
+        Args:
+            date (str): Дата в формате 'ГГГГ-ММ-ДД'
+        Returns:
+            list: Отсортированный список непересекающихся интервалов (начало, конец)
+        """
+        merged = self._merged_busy.get(date)
+        if merged is None:
+            # Обход дерева уже упорядочен по началу, поэтому сортировка при слиянии линейна
+            merged = self._merge_overlapping_slots(list(self._trees[date]))
+            self._merged_busy[date] = merged
+            self._starts_by_date[date] = [start for start, _ in merged]
+            self._ends_by_date[date] = [end for _, end in merged]
         return merged
 
+    def _get_busy_minutes(self, date):
+        """Возвращает объединенные занятые интервалы даты как параллельные списки.
+        Args:
+            date (str): Дата в формате 'ГГГГ-ММ-ДД'
+        Returns:
+            tuple: (список начал, список концов) в минутах
+        """
+        self._get_merged_busy(date)
+        return self._starts_by_date[date], self._ends_by_date[date]
+
     def get_busy_slots(self, date):
         """Возвращает занятые промежутки времени для указанной даты.
         Args:
@@ -109,11 +338,41 @@ class Scheduler:
         Returns:
             list: Список кортежей (начало, конец) занятых промежутков
         """
-        if date not in self.timeslots:
+        if date not in self._trees:
             return []
 
-        busy_slots = self.timeslots[date]
-        return self._merge_overlapping_slots(busy_slots)
+        starts, ends = self._get_busy_minutes(date)
+        make_pair = self._make_pair
+        return [make_pair(start, end) for start, end in zip(starts, ends)]
+
+    def _compute_free_minutes(self, date):
+        """Вычисляет свободные промежутки указанной даты в минутах.
+        Args:
+            date (str): Дата в формате 'ГГГГ-ММ-ДД'
+        Returns:
+            list: Список кортежей (начало, конец, длительность) в минутах
+        """
+        work_start, work_end = self._work_min_by_date[date]
+        busy_slots = self._get_merged_busy(date)
+        return _free_intervals(busy_slots, work_start, work_end)
+
+    def _compute_free_mask(self, date):
+        """Строит битовую маску свободных минут рабочего дня.
+        Args:
+            date (str): Дата в формате 'ГГГГ-ММ-ДД'
+        Returns:
+            int: Маска, где бит i установлен, если минута i свободна; None, если
+                среди занятых есть пустые интервалы, которые маска не выражает
+        """
+        work_start, work_end = self._work_min_by_date[date]
+        mask = ((1 << max(work_end - work_start, 0)) - 1) << work_start
+
+        for busy_start, busy_end in self._get_merged_busy(date):
+            if busy_start >= busy_end:
+                return None
+            mask &= ~(((1 << (busy_end - busy_start)) - 1) << busy_start)
+
+        return mask
 
     def get_free_slots(self, date):
         """Возвращает свободные промежутки времени для указанной даты.
@@ -125,31 +384,8 @@ class Scheduler:
         if date not in self.days:
             return []
 
-        work_day = self.days[date]
-        work_start, work_end = self._parse_time_range(work_day['start'], work_day['end'])
-        busy_slots = self.get_busy_slots(date)
-
-        free_slots = []
-        prev_end = work_start  # Отслеживаем конец последнего занятого/рабочего периода
-
-        for busy_start, busy_end in busy_slots:
-            busy_start_min, busy_end_min = self._parse_time_range(busy_start, busy_end)
-            if busy_start_min > prev_end:
-                # Добавляем свободный промежуток между предыдущим концом и началом занятого
-                free_slots.append((
-                    self._minutes_to_time(prev_end),
-                    self._minutes_to_time(busy_start_min)
-                ))
-            prev_end = max(prev_end, busy_end_min)
-
-        # Добавляем оставшийся свободный промежуток в конце дня
-        if prev_end < work_end:
-            free_slots.append((
-                self._minutes_to_time(prev_end),
-                self._minutes_to_time(work_end)
-            ))
-
-        return free_slots
+        make_pair = self._make_pair
+        return [make_pair(start, end) for start, end, _ in self._free_by_date[date]]
 
     def is_available(self, date, start, end):
         """Проверяет доступность временного промежутка.
@@ -163,24 +399,147 @@ class Scheduler:
         if date not in self.days:
             return False
 
-        work_day = self.days[date]
-        work_start, work_end = self._parse_time_range(work_day['start'], work_day['end'])
         slot_start, slot_end = self._parse_time_range(start, end)
 
+        # Слот доступен, если все его минуты свободны в маске рабочего дня
+        free_mask = self._free_masks[date]
+        if free_mask is not None and slot_start < slot_end:
+            slot_mask = ((1 << (slot_end - slot_start)) - 1) << slot_start
+            return free_mask & slot_mask == slot_mask
+
+        # Пустые и перевернутые интервалы маска не выражает: проверяем их по
+        # границам дня и объединенным занятым слотам, как get_busy_slots
+        work_start, work_end = self._work_min_by_date[date]
+
         # Проверяем, что слот в пределах рабочего дня
         if slot_start < work_start or slot_end > work_end:
             return False
 
-        busy_slots = self.get_busy_slots(date)
-
-        # Проверяем пересечение с занятыми слотами
-        for busy_start, busy_end in busy_slots:
-            busy_start_min, busy_end_min = self._parse_time_range(busy_start, busy_end)
-            if not (slot_end <= busy_start_min or slot_start >= busy_end_min):
+        # Проверяем пересечение с объединенными занятыми слотами
+        for busy_start, busy_end in self._get_merged_busy(date):
+            if not (slot_end <= busy_start or slot_start >= busy_end):
                 return False
 
         return True
 
+    def add_busy(self, date, start, end):
+        """Добавляет занятый промежуток в расписание.
+        Args:
+            date (str): Дата в формате 'ГГГГ-ММ-ДД'
+            start (str): Начало промежутка 'ЧЧ:ММ'
+            end (str): Конец промежутка 'ЧЧ:ММ'
+        Returns:
+            bool: Добавлен ли промежуток (False, если даты нет в расписании)
+        """
+        if date not in self.days:
+            return False
+
+        self._trees[date].insert(*self._parse_time_range(start, end))
+        self.timeslots[date].append((start, end))
+        self._refresh_date(date)
+        return True
+
+    def remove_busy(self, date, start, end):
+        """Удаляет занятый промежуток из расписания.
+        Args:
+            date (str): Дата в формате 'ГГГГ-ММ-ДД'
+            start (str): Начало промежутка 'ЧЧ:ММ'
+            end (str): Конец промежутка 'ЧЧ:ММ'
+        Returns:
+            bool: Был ли такой промежуток найден и удален
+        """
+        if date not in self.days:
+            return False
+
+        interval = self._parse_time_range(start, end)
+        if not self._trees[date].remove(*interval):
+            return False
+
+        # Удаляем из таймслотов первую запись с тем же интервалом
+        slots = self.timeslots[date]
+        for index, (slot_start, slot_end) in enumerate(slots):
+            if self._parse_time_range(slot_start, slot_end) == interval:
+                del slots[index]
+                break
+        self._refresh_date(date)
+        return True
+
+    def _refresh_date(self, date):
+        """Пересчитывает кэши даты после изменения ее занятых промежутков.
+        Args:
+            date (str): Дата в формате 'ГГГГ-ММ-ДД'
+        """
+        self._merged_busy.pop(date, None)
+        free_slots = self._compute_free_minutes(date)
+        self._free_by_date[date] = free_slots
+        self._max_free_by_date[date] = max((duration for _, _, duration in free_slots), default=0)
+        self._free_masks[date] = self._compute_free_mask(date)
+
+        # Обновляем лист дерева отрезков и максимумы на пути к корню
+        tree = self._capacity_tree
+        node = len(tree) // 2 + bisect_left(self._sorted_dates, date)
+        tree[node] = self._max_free_by_date[date]
+        node //= 2
+        while node:
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            node //= 2
+
+    def _build_capacity_tree(self):
+        """Строит дерево отрезков по самым длинным свободным окнам дней.
+        Листья лежат в хронологическом порядке дат, каждый внутренний узел
+        хранит максимум своих потомков.
+        Returns:
+            list: Дерево в массиве, корень в элементе 1
+        """
+        size = 1
+        while size < len(self._sorted_dates):
+            size *= 2
+
+        tree = [0] * (2 * size)
+        for index, date in enumerate(self._sorted_dates):
+            tree[size + index] = self._max_free_by_date[date]
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+
+        return tree
+
+    def _make_finder(self, duration_minutes):
+        """Строит функцию поиска слота для фиксированной продолжительности.
+        Длительность и структуры планировщика захватываются замыканием, поэтому
+        повторные запросы не читают атрибуты экземпляра.
+        Args:
+            duration_minutes (int): Продолжительность в минутах
+        Returns:
+            function: Функция без аргументов, возвращающая (дата, начало, конец) или None
+        """
+        # Свободные окна всегда длиннее нуля, поэтому меньшие длительности ищем как минуту
+        required = max(duration_minutes, 1)
+        tree = self._capacity_tree
+        sorted_dates = self._sorted_dates
+        free_by_date = self._free_by_date
+        minutes_to_time = self._minutes_to_time
+
+        def find():
+            if tree[1] < required:
+                return None
+
+            # Спускаемся от корня, выбирая левое поддерево, когда оно вмещает длительность
+            size = len(tree) // 2
+            node = 1
+            while node < size:
+                node *= 2
+                if tree[node] < required:
+                    node += 1
+
+            date = sorted_dates[node - size]
+            for start_min, _, available_duration in free_by_date[date]:
+                if available_duration >= required:
+                    return (date, minutes_to_time(start_min), minutes_to_time(start_min + duration_minutes))
+
+            return None
+
+        return find
+
     def find_slot_for_duration(self, duration_minutes):
         """Находит первый подходящий свободный слот для указанной продолжительности.
         Args:
@@ -188,14 +547,11 @@ class Scheduler:
         Returns:
             tuple: (дата, начало, конец) или None, если слот не найден
         """
-        # Проверяем дни в хронологическом порядке
-        for date in sorted(self.days.keys()):
-            free_slots = self.get_free_slots(date)
-            for start, end in free_slots:
-                start_min = self._time_to_minutes(start)
-                end_min = self._time_to_minutes(end)
-                available_duration = end_min - start_min
-                if available_duration >= duration_minutes:
-                    return (date, start, self._minutes_to_time(start_min + duration_minutes))
-
-        return None
\ No newline at end of file
+        finder = self._finders.get(duration_minutes)
+        if finder is None:
+            if len(self._finders) >= _FINDER_CACHE_SIZE:
+                del self._finders[next(iter(self._finders))]  # Вытесняем самую старую
+            finder = self._make_finder(duration_minutes)
+            self._finders[duration_minutes] = finder
+
+        return finder()
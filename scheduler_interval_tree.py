@@ -0,0 +1,225 @@
+class _Node:
+    __slots__ = ('low', 'high', 'maxupper', 'minlower', 'height', 'left', 'right')
+
+    def __init__(self, low, high):
+        """Узел дерева интервалов.
+        Args:
+            low (int): Начало интервала
+            high (int): Конец интервала
+        """
+        self.low = low
+        self.high = high
+        self.maxupper = high  # Наибольший конец интервала в поддереве
+        self.minlower = low  # Наименьшее начало интервала в поддереве
+        self.height = 1
+        self.left = None
+        self.right = None
+
+
+def _height(node):
+    """Возвращает высоту поддерева (0 для пустого)."""
+    return node.height if node is not None else 0
+
+
+def _update(node):
+    """Пересчитывает высоту и агрегаты узла по его потомкам."""
+    left, right = node.left, node.right
+    node.height = 1 + max(_height(left), _height(right))
+    node.maxupper = node.high
+    node.minlower = node.low
+    if left is not None:
+        if left.maxupper > node.maxupper:
+            node.maxupper = left.maxupper
+        if left.minlower < node.minlower:
+            node.minlower = left.minlower
+    if right is not None:
+        if right.maxupper > node.maxupper:
+            node.maxupper = right.maxupper
+        if right.minlower < node.minlower:
+            node.minlower = right.minlower
+
+
+def _rotate_right(node):
+    """Малый правый поворот вокруг узла."""
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    """Малый левый поворот вокруг узла."""
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    """Восстанавливает AVL-баланс узла после вставки или удаления."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def _insert(node, low, high):
+    """Вставляет интервал в поддерево и возвращает его новый корень."""
+    if node is None:
+        return _Node(low, high)
+    if (low, high) < (node.low, node.high):
+        node.left = _insert(node.left, low, high)
+    else:
+        node.right = _insert(node.right, low, high)
+    return _rebalance(node)
+
+
+def _pop_min(node):
+    """Удаляет самый левый узел поддерева.
+    Returns:
+        tuple: (новый корень поддерева, удаленный узел)
+    """
+    if node.left is None:
+        return node.right, node
+    node.left, smallest = _pop_min(node.left)
+    return _rebalance(node), smallest
+
+
+def _remove(node, low, high):
+    """Удаляет один интервал (low, high) из поддерева.
+    Returns:
+        tuple: (новый корень поддерева, был ли интервал найден)
+    """
+    if node is None:
+        return None, False
+
+    key = (low, high)
+    node_key = (node.low, node.high)
+    if key < node_key:
+        node.left, found = _remove(node.left, low, high)
+    elif key > node_key:
+        node.right, found = _remove(node.right, low, high)
+    else:
+        found = True
+        if node.left is None:
+            return node.right, found
+        if node.right is None:
+            return node.left, found
+        # Заменяем узел его преемником из правого поддерева
+        node.right, successor = _pop_min(node.right)
+        successor.left, successor.right = node.left, node.right
+        node = successor
+
+    if not found:
+        return node, found
+    return _rebalance(node), found
+
+
+class IntervalTree:
+    """AVL-дерево полуоткрытых интервалов [low, high).
+
+    Узлы упорядочены по (low, high) и хранят агрегаты поддерева maxupper и
+    minlower, что позволяет отсекать ветви без пересечений при запросах.
+    """
+    __slots__ = ('_root', '_size')
+
+    def __init__(self, intervals=()):
+        """Создает дерево.
+        Args:
+            intervals (iterable): Начальные интервалы [(low, high), ...]
+        """
+        self._root = None
+        self._size = 0
+        for low, high in intervals:
+            self.insert(low, high)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Обходит интервалы в порядке (low, high)."""
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.low, node.high
+            node = node.right
+
+    def insert(self, low, high):
+        """Добавляет интервал за O(log n).
+        Args:
+            low (int): Начало интервала
+            high (int): Конец интервала
+        """
+        self._root = _insert(self._root, low, high)
+        self._size += 1
+
+    def remove(self, low, high):
+        """Удаляет один экземпляр интервала за O(log n).
+        Args:
+            low (int): Начало интервала
+            high (int): Конец интервала
+        Returns:
+            bool: Был ли интервал найден и удален
+        """
+        self._root, found = _remove(self._root, low, high)
+        if found:
+            self._size -= 1
+        return found
+
+    def overlaps(self, low, high):
+        """Проверяет, пересекает ли какой-либо интервал промежуток [low, high).
+        Args:
+            low (int): Начало промежутка
+            high (int): Конец промежутка
+        Returns:
+            bool: Есть ли пересечение
+        """
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            # Отсекаем поддеревья, целиком лежащие левее или правее промежутка
+            if node is None or node.maxupper <= low or node.minlower >= high:
+                continue
+            if node.low < high and node.high > low:
+                return True
+            stack.append(node.left)
+            if node.low < high:
+                stack.append(node.right)
+        return False
+
+    def query(self, low, high):
+        """Возвращает все интервалы, пересекающие промежуток [low, high), за O(log n + k).
+        Args:
+            low (int): Начало промежутка
+            high (int): Конец промежутка
+        Returns:
+            list: Пересекающиеся интервалы [(low, high), ...] в порядке возрастания
+        """
+        result = []
+        self._query(self._root, low, high, result)
+        return result
+
+    def _query(self, node, low, high, result):
+        """Рекурсивно собирает пересечения в result (INTERVAL-QUERY)."""
+        if node is None or node.maxupper <= low or node.minlower >= high:
+            return
+        self._query(node.left, low, high, result)
+        if node.low < high and node.high > low:
+            result.append((node.low, node.high))
+        if node.low < high:
+            self._query(node.right, low, high, result)
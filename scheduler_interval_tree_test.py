@@ -0,0 +1,40 @@
+import unittest
+from scheduler_interval_tree import IntervalTree
+
+
+class TestIntervalTree(unittest.TestCase):
+    def setUp(self):
+        self.tree = IntervalTree([(660, 720), (570, 960), (600, 630), (570, 600)])
+
+    def test_iteration_order(self):
+        # Интервалы обходятся в порядке (начало, конец)
+        self.assertEqual(list(self.tree), [(570, 600), (570, 960), (600, 630), (660, 720)])
+        self.assertEqual(len(self.tree), 4)
+
+    def test_query(self):
+        # Промежуток пересекает несколько интервалов
+        self.assertEqual(self.tree.query(590, 610), [(570, 600), (570, 960), (600, 630)])
+
+        # Касание границы не считается пересечением
+        self.assertEqual(self.tree.query(960, 1000), [])
+        self.assertFalse(self.tree.overlaps(500, 570))
+        self.assertTrue(self.tree.overlaps(700, 701))
+
+    def test_remove(self):
+        self.assertTrue(self.tree.remove(570, 960))
+        self.assertEqual(list(self.tree), [(570, 600), (600, 630), (660, 720)])
+        self.assertFalse(self.tree.overlaps(630, 660))
+
+        # Удаление отсутствующего интервала ничего не меняет
+        self.assertFalse(self.tree.remove(570, 960))
+        self.assertEqual(len(self.tree), 3)
+
+    def test_balanced(self):
+        # Последовательная вставка не вырождает дерево в список
+        tree = IntervalTree((minute, minute + 1) for minute in range(1024))
+        self.assertLessEqual(tree._root.height, 15)
+        self.assertTrue(tree.overlaps(1023, 1024))
+
+
+if __name__ == '__main__':
+    unittest.main()
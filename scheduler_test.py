@@ -1,11 +1,14 @@
+import asyncio
+import json
 import unittest
 from unittest.mock import patch, Mock
-from scheduler import Scheduler
+from scheduler import Scheduler, _FETCH_CACHE
 
 
 class TestScheduler(unittest.TestCase):
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def setUp(self, mock_get):
+        Scheduler.invalidate_cache()
         mock_data = {
             "days": [
                 {"id": 1, "date": "2024-10-10", "start": "09:00", "end": "18:00"},
@@ -18,9 +21,21 @@ class TestScheduler(unittest.TestCase):
         }
         mock_response = Mock()
         mock_response.json.return_value = mock_data
+        mock_response.content = json.dumps(mock_data).encode()
         mock_get.return_value = mock_response
 
         self.scheduler = Scheduler(url="https://example.com")
+        self.mock_data = mock_data
+
+    def tearDown(self):
+        Scheduler.invalidate_cache()
+
+    @patch('requests.Session.get')
+    def _make_scheduler(self, data, mock_get):
+        # Планировщик с произвольными данными вместо данных из setUp
+        mock_get.return_value.json.return_value = data
+        mock_get.return_value.content = json.dumps(data).encode()
+        return Scheduler(url="https://example.com/custom")
 
     def test_get_busy_slots(self):
         # Тест для даты с занятыми слотами
@@ -63,6 +78,148 @@ class TestScheduler(unittest.TestCase):
         result = self.scheduler.find_slot_for_duration(1000)
         self.assertIsNone(result)
 
+    def test_time_to_minutes(self):
+        # Строки и байты 'ЧЧ:ММ', а также время без ведущего нуля
+        self.assertEqual(self.scheduler._time_to_minutes("09:30"), 570)
+        self.assertEqual(self.scheduler._time_to_minutes(b"09:30"), 570)
+        self.assertEqual(self.scheduler._time_to_minutes("9:30"), 570)
+        self.assertEqual(self.scheduler._time_to_minutes(b"9:30"), 570)
+
+    def test_free_mask(self):
+        # Биты установлены для свободных минут рабочего дня
+        expected = ((1 << 120) - 1) << 540 | ((1 << 360) - 1) << 720
+        self.assertEqual(self.scheduler._free_masks["2024-10-10"], expected)
+
+        # Пустой занятый промежуток маской не выражается
+        self.assertTrue(self.scheduler.add_busy("2024-10-10", "10:00", "10:00"))
+        self.assertIsNone(self.scheduler._free_masks["2024-10-10"])
+        self.assertFalse(self.scheduler.is_available("2024-10-10", "09:30", "10:30"))
+        self.assertTrue(self.scheduler.is_available("2024-10-10", "09:00", "10:00"))
+
+        # После удаления пустого промежутка маска восстанавливается
+        self.assertTrue(self.scheduler.remove_busy("2024-10-10", "10:00", "10:00"))
+        self.assertEqual(self.scheduler._free_masks["2024-10-10"], expected)
+
+    def test_free_mask_inverted_work_day(self):
+        # Рабочий день с концом раньше начала не содержит свободных минут
+        scheduler = self._make_scheduler({
+            "days": [{"id": 1, "date": "2024-10-10", "start": "18:00", "end": "09:00"}],
+            "timeslots": []
+        })
+        self.assertEqual(scheduler._free_masks["2024-10-10"], 0)
+        self.assertFalse(scheduler.is_available("2024-10-10", "10:00", "11:00"))
+        self.assertEqual(scheduler.get_free_slots("2024-10-10"), [])
+
+    def test_free_mask_matches_fallback(self):
+        # Проверка по маске совпадает с проверкой по объединенным занятым слотам
+        times = [f"{minute // 60:02d}:{minute % 60:02d}" for minute in range(420, 1140, 30)]
+        for date in ("2024-10-10", "2024-10-11"):
+            slots = [(start, end) for start in times for end in times if start < end]
+            with_mask = [self.scheduler.is_available(date, start, end) for start, end in slots]
+            self.scheduler._free_masks[date] = None
+            without_mask = [self.scheduler.is_available(date, start, end) for start, end in slots]
+            self.assertEqual(with_mask, without_mask)
+            self.assertIn(True, with_mask)
+            self.assertIn(False, with_mask)
+
+    def test_slots_past_midnight(self):
+        # Время после 24:00 форматируется так же, как и раньше, без ошибок
+        scheduler = self._make_scheduler({
+            "days": [{"id": 1, "date": "2024-10-10", "start": "20:00", "end": "25:00"}],
+            "timeslots": [{"id": 1, "day_id": 1, "start": "23:30", "end": "24:30"}]
+        })
+        self.assertEqual(scheduler.get_busy_slots("2024-10-10"), [("23:30", "24:30")])
+        self.assertEqual(scheduler.get_free_slots("2024-10-10"), [("20:00", "23:30"), ("24:30", "25:00")])
+        self.assertEqual(scheduler.find_slot_for_duration(30), ("2024-10-10", "20:00", "20:30"))
+
+    def test_add_and_remove_busy(self):
+        # Новый занятый промежуток сливается с существующим
+        self.assertTrue(self.scheduler.add_busy("2024-10-10", "12:00", "13:00"))
+        self.assertEqual(self.scheduler.get_busy_slots("2024-10-10"), [("11:00", "13:00")])
+        self.assertFalse(self.scheduler.is_available("2024-10-10", "12:30", "13:00"))
+        self.assertEqual(self.scheduler.get_free_slots("2024-10-10"), [("09:00", "11:00"), ("13:00", "18:00")])
+
+        # После удаления промежуток снова свободен
+        self.assertTrue(self.scheduler.remove_busy("2024-10-10", "12:00", "13:00"))
+        self.assertTrue(self.scheduler.is_available("2024-10-10", "12:30", "13:00"))
+        self.assertEqual(self.scheduler.get_busy_slots("2024-10-10"), [("11:00", "12:00")])
+
+        # Занятость всего первого дня переносит поиск на следующий день
+        self.assertTrue(self.scheduler.add_busy("2024-10-10", "09:00", "18:00"))
+        self.assertEqual(self.scheduler.find_slot_for_duration(60), ("2024-10-11", "08:00", "09:00"))
+
+        # Пустой слот на стыке двух занятых подряд промежутков недоступен
+        self.assertTrue(self.scheduler.add_busy("2024-10-11", "16:00", "16:30"))
+        self.assertEqual(self.scheduler.get_busy_slots("2024-10-11"), [("09:30", "16:30")])
+        self.assertFalse(self.scheduler.is_available("2024-10-11", "16:00", "16:00"))
+        self.assertFalse(self.scheduler.is_available("2024-10-11", "15:45", "15:45"))
+
+        # Неизвестная дата и отсутствующий промежуток
+        self.assertFalse(self.scheduler.add_busy("2024-10-12", "10:00", "11:00"))
+        self.assertFalse(self.scheduler.remove_busy("2024-10-10", "14:00", "15:00"))
+
+    @patch('requests.Session.get')
+    def test_fetch_data_cached(self, mock_get):
+        # Повторное создание планировщика использует закэшированный ответ
+        Scheduler(url="https://example.com")
+        mock_get.assert_not_called()
+
+        # После сброса кэша данные загружаются заново
+        Scheduler.invalidate_cache("https://example.com")
+        mock_get.return_value.json.return_value = self.mock_data
+        mock_get.return_value.content = json.dumps(self.mock_data).encode()
+        Scheduler(url="https://example.com")
+        mock_get.assert_called_once()
+
+    @patch('scheduler._FETCH_CACHE_SIZE', 2)
+    @patch('requests.Session.get')
+    def test_fetch_cache_bounded(self, mock_get):
+        Scheduler.invalidate_cache()
+        mock_get.return_value.json.return_value = self.mock_data
+        mock_get.return_value.content = json.dumps(self.mock_data).encode()
+
+        # При превышении размера вытесняется URL, к которому дольше всего не обращались
+        Scheduler(url="https://example.com/a")
+        Scheduler(url="https://example.com/b")
+        Scheduler(url="https://example.com/a")
+        Scheduler(url="https://example.com/c")
+        self.assertEqual(list(_FETCH_CACHE), ["https://example.com/a", "https://example.com/c"])
+
+        # Устаревшая запись удаляется при обращении и загружается заново
+        with patch('scheduler._FETCH_TTL', 0):
+            Scheduler(url="https://example.com/a")
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(list(_FETCH_CACHE), ["https://example.com/c", "https://example.com/a"])
+
+    @patch('requests.Session.get')
+    def test_create_many(self, mock_get):
+        Scheduler.invalidate_cache()
+        mock_get.return_value.json.return_value = self.mock_data
+        mock_get.return_value.content = json.dumps(self.mock_data).encode()
+        urls = ["https://example.com/a", "https://example.com/b"]
+
+        schedulers = asyncio.run(Scheduler.create_many(urls))
+
+        # Каждый URL загружается один раз, порядок планировщиков совпадает с порядком URL
+        self.assertEqual([scheduler.url for scheduler in schedulers], urls)
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(schedulers[1].get_busy_slots("2024-10-10"), [("11:00", "12:00")])
+
+    @patch('requests.Session.get')
+    def test_create_many_uses_fetch_data(self, mock_get):
+        # Подкласс с собственной загрузкой данных не обращается к сети
+        mock_data = self.mock_data
+
+        class StaticScheduler(Scheduler):
+            def _fetch_data(self):
+                return mock_data
+
+        schedulers = asyncio.run(StaticScheduler.create_many(["a", "b"]))
+
+        mock_get.assert_not_called()
+        self.assertEqual([scheduler.url for scheduler in schedulers], ["a", "b"])
+        self.assertEqual(schedulers[0].get_free_slots("2024-10-11"), [("08:00", "09:30"), ("16:00", "17:00")])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file